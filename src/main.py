@@ -3,12 +3,15 @@
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.responses import ORJSONResponse, PlainTextResponse, Response
 from typing import Dict, List, Optional
 import httpx
+import orjson
 import asyncio
-import re
+import os
+import time
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from contextlib import asynccontextmanager
 from scraper import ForecastScraper
 from slowapi import Limiter, _rate_limit_exceeded_handler
@@ -18,30 +21,43 @@ from slowapi.middleware import SlowAPIMiddleware
 import logging
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
 logger = logging.getLogger(__name__)
 
+# Process start on the monotonic clock, used for cheap uptime reporting in /health
+APP_MONO_START = time.monotonic()
+
 # Initialize rate limiter
 limiter = Limiter(key_func=get_remote_address)
 
 # Initialize the forecast scraper
 scraper = ForecastScraper()
 
-# Input validation patterns
-ZONE_PATTERN = re.compile(r'^pzz\d{3}$', re.IGNORECASE)
+# Maximum number of zone fetches in flight during a cache refresh
+MAX_CONCURRENT_FETCHES = 6
+
+# Skip a scheduled refresh if the cache was updated this recently (e.g. after a restart)
+MIN_REFRESH_GAP_MINUTES = 10
 
-# In-memory cache for forecasts
-forecast_cache = {}
+# Single-writer guard so manual and scheduled refreshes never overlap
+_refresh_lock = asyncio.Lock()
+
+# Cache metadata; the forecast cache itself lives on app.state so each
+# refresh can publish a complete new snapshot with a single swap
 cache_metadata = {
     "last_updated": None,
     "next_update": None,
     "update_interval_minutes": 120,  # Increased from 30 to 120 minutes for personal use
     "total_updates": 0,
-    "last_update_duration": None
+    "last_update_duration": None,
+    "successful_zones": [],
+    "failed_zones": [],
+    "successful_count": 0,
+    "failed_count": 0
 }
 
 # Available forecast zones
-ZONES = {
+ZONES = MappingProxyType({
     "pzz100": "Synopsis for Northern and Central Washington Coastal and Inland Waters",
     "pzz110": "Grays Harbor Bar",
     "pzz130": "West Entrance U.S. Waters Strait Of Juan De Fuca",
@@ -56,12 +72,51 @@ ZONES = {
     "pzz170": "Coastal Waters From Cape Flattery To James Island 10 To 60 Nm",
     "pzz173": "Coastal Waters From James Island To Point Grenville 10 To 60 Nm",
     "pzz176": "Coastal Waters From Point Grenville To Cape Shoalwater 10 To 60 Nm"
-}
+})
+ZONE_KEYS_TUPLE = tuple(ZONES.keys())
+ZONE_KEYS_FROZENSET = frozenset(ZONES.keys())
+# Zone list as shown in 404 details, formatted once
+ZONE_KEYS_DETAIL = str(list(ZONES.keys()))
+ZONE_URLS = MappingProxyType({zone: f"{ForecastScraper.BASE_URL}/{zone}.txt" for zone in ZONES})
+
+# The zone list never changes, so serialize its response once at import
+ZONES_RESPONSE = ORJSONResponse({"zones": dict(ZONES)})
+
+def build_all_forecasts_payload(successful_forecasts: List[dict], failed_zones: List[dict]) -> dict:
+    """Build the /forecast/ response body from a refresh's partitioned results"""
+    return {
+        "total_zones": len(ZONES),
+        "successful_forecasts": len(successful_forecasts),
+        "failed_forecasts": len(failed_zones),
+        "forecasts": successful_forecasts,
+        "errors": failed_zones if failed_zones else None,
+        "cache_info": {
+            "last_updated": cache_metadata["last_updated"],
+            "next_update": cache_metadata["next_update"],
+            "data_served_from": "cache"
+        }
+    }
+
+def next_refresh_time(now: datetime) -> datetime:
+    """Next clock-aligned refresh boundary (multiples of the interval since midnight)"""
+    interval = cache_metadata["update_interval_minutes"]
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    minutes_since_midnight = now.hour * 60 + now.minute
+    return midnight + timedelta(minutes=(minutes_since_midnight // interval + 1) * interval)
 
 async def update_forecast_cache():
+    """Update the forecast cache, joining any refresh already in flight"""
+    if _refresh_lock.locked():
+        # Wait for the running refresh and reuse its result rather than fetching again
+        async with _refresh_lock:
+            return
+    async with _refresh_lock:
+        await _refresh_forecast_cache()
+
+async def _refresh_forecast_cache():
     """Update the forecast cache with data from NOAA"""
     start_time = datetime.now()
-    print(f"[{start_time.strftime('%Y-%m-%d %H:%M:%S')}] Starting forecast cache update...")
+    logger.info("Starting forecast cache update...")
     
     async def fetch_zone_forecast(zone: str):
         """Helper function to fetch a single zone's forecast"""
@@ -70,8 +125,8 @@ async def update_forecast_cache():
             return zone, {
                 "zone": forecast.zone,
                 "name": forecast.name,
-                "issued": forecast.issued.isoformat(),
-                "expires": forecast.expires.isoformat(),
+                "issued": forecast.issued,
+                "expires": forecast.expires,
                 "periods": [
                     {
                         "name": period.name,
@@ -83,56 +138,97 @@ async def update_forecast_cache():
                 ]
             }
         except Exception as e:
-            print(f"Error fetching forecast for {zone}: {str(e)}")
+            logger.error("Error fetching forecast for %s: %s", zone, e)
             return zone, {"error": f"Failed to fetch forecast: {str(e)}"}
     
+    # Bound concurrency so a slow NOAA day doesn't stall every zone at once
+    sem = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    
+    async def bounded(zone: str):
+        async with sem:
+            return await fetch_zone_forecast(zone)
+    
     try:
-        # Fetch all forecasts concurrently
-        tasks = [fetch_zone_forecast(zone) for zone in ZONES.keys()]
-        results = await asyncio.gather(*tasks)
+        # Fetch all forecasts concurrently; per-zone errors are captured by
+        # fetch_zone_forecast, so the group only aborts on cancellation
+        async with asyncio.TaskGroup() as tg:
+            handles = [tg.create_task(bounded(zone)) for zone in ZONE_KEYS_TUPLE]
+        results = [handle.result() for handle in handles]
         
-        # Update cache
+        # Update cache, partitioning successes from errors once per refresh
         new_cache = {}
-        successful_count = 0
-        failed_count = 0
+        new_successful = []
+        new_failed = []
         
         for zone, forecast_data in results:
             new_cache[zone] = forecast_data
             if "error" in forecast_data:
-                failed_count += 1
+                new_failed.append({"zone": zone, "error": forecast_data["error"]})
             else:
-                successful_count += 1
+                new_successful.append((zone, forecast_data))
+        successful_zones = [zone for zone, _ in new_successful]
+        failed_zones = [failed["zone"] for failed in new_failed]
+        successful_count = len(successful_zones)
+        failed_count = len(failed_zones)
         
-        # Update global cache and metadata
-        global forecast_cache, cache_metadata
-        forecast_cache = new_cache
+        # Serialize each forecast once here rather than on every request
+        new_json_cache = {zone: orjson.dumps(forecast_data) for zone, forecast_data in new_successful}
         
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
         
         cache_metadata.update({
-            "last_updated": end_time.isoformat(),
-            "next_update": (end_time + timedelta(minutes=cache_metadata["update_interval_minutes"])).isoformat(),
+            "last_updated": end_time,
+            "next_update": next_refresh_time(end_time),
             "total_updates": cache_metadata["total_updates"] + 1,
-            "last_update_duration": f"{duration:.2f} seconds"
+            "last_update_duration": f"{duration:.2f} seconds",
+            "successful_zones": successful_zones,
+            "failed_zones": failed_zones,
+            "successful_count": successful_count,
+            "failed_count": failed_count
         })
+        new_all_json = orjson.dumps(build_all_forecasts_payload(
+            [forecast_data for _, forecast_data in new_successful], new_failed
+        ))
         
-        print(f"[{end_time.strftime('%Y-%m-%d %H:%M:%S')}] Cache update completed: {successful_count} successful, {failed_count} failed, took {duration:.2f}s")
+        # Publish the new snapshot; readers see either the old or the new cache, never a mix
+        app.state.cache = new_cache
+        app.state.cache_json = new_json_cache
+        app.state.all_forecasts_json = new_all_json
+        
+        logger.info("Cache update completed: %d successful, %d failed, took %.2fs", successful_count, failed_count, duration)
         
     except Exception as e:
-        print(f"Error updating forecast cache: {str(e)}")
+        logger.error("Error updating forecast cache: %s", e)
 
 async def background_update_task():
-    """Background task that updates forecasts every 30 minutes"""
+    """Background task that refreshes forecasts on clock-aligned boundaries"""
+    retry_now = False
     while True:
         try:
+            if not retry_now:
+                # Sleep until the next boundary so restarted replicas refresh in step
+                now = datetime.now()
+                await asyncio.sleep((next_refresh_time(now) - now).total_seconds())
+                
+                last_updated = cache_metadata["last_updated"]
+                now = datetime.now()
+                if last_updated and now - last_updated < timedelta(minutes=MIN_REFRESH_GAP_MINUTES):
+                    # Report the boundary we'll actually refresh at, not the one being skipped
+                    cache_metadata["next_update"] = next_refresh_time(now)
+                    logger.info("Skipping scheduled cache update, cache was refreshed recently")
+                    continue
+            
+            retry_now = False
             await update_forecast_cache()
-            # Wait 120 minutes before next update (optimized for personal use)
-            await asyncio.sleep(cache_metadata["update_interval_minutes"] * 60)
+        except asyncio.CancelledError:
+            # Propagate so shutdown isn't delayed by the retry sleep
+            raise
         except Exception as e:
-            print(f"Error in background update task: {str(e)}")
-            # Wait 5 minutes before retrying on error
+            logger.error("Error in background update task: %s", e)
+            # Wait 5 minutes, then retry right away instead of waiting for the next boundary
             await asyncio.sleep(5 * 60)
+            retry_now = True
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -140,6 +236,21 @@ async def lifespan(app: FastAPI):
     # Startup
     print("Starting Puget Sound Marine Forecast API...")
     
+    # Shared HTTP client so every zone fetch reuses pooled connections
+    global scraper
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        # No pool timeout: a fetch waiting for a free connection is bounded by the
+        # refresh semaphore, not cut short while another fetch is mid-read
+        timeout=httpx.Timeout(**{**ForecastScraper.TIMEOUT_SECONDS, "pool": None}),
+        # One connection per in-flight fetch, so even if HTTP/2 isn't negotiated and
+        # each HTTP/1.1 request needs its own socket, no fetch waits on the pool
+        limits=httpx.Limits(max_connections=MAX_CONCURRENT_FETCHES, max_keepalive_connections=MAX_CONCURRENT_FETCHES),
+        # Forecast text compresses well; httpx decodes the body transparently
+        headers={"Accept-Encoding": "gzip, deflate, br", "User-Agent": "pz-forecast/1.0"}
+    )
+    scraper = ForecastScraper(client=app.state.http, zone_urls=ZONE_URLS)
+    
     # Initial cache population
     await update_forecast_cache()
     
@@ -156,14 +267,21 @@ async def lifespan(app: FastAPI):
         await task
     except asyncio.CancelledError:
         print("Background task cancelled")
+    await app.state.http.aclose()
 
 app = FastAPI(
     title="Puget Sound Marine Forecast API",
     description="API for accessing Puget Sound marine weather forecasts",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+# Forecast cache, populated by update_forecast_cache
+app.state.cache = {}
+app.state.cache_json = {}
+app.state.all_forecasts_json = None
+
 # Security middleware
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
@@ -191,23 +309,24 @@ app.add_middleware(SlowAPIMiddleware)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler to prevent information leakage"""
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={"detail": "Internal server error"}
     )
 
 # Robots.txt to reduce 404s from crawlers
+ROBOTS_RESPONSE = PlainTextResponse(content=(
+    "User-agent: *\n"
+    "Allow: /\n"
+    "Disallow: /cache/\n"
+    "Disallow: /cache/status\n"
+    "Disallow: /cache/refresh\n"
+))
+
 @app.get("/robots.txt", include_in_schema=False)
 async def robots_txt():
     """Robots policy for crawlers."""
-    rules = (
-        "User-agent: *\n"
-        "Allow: /\n"
-        "Disallow: /cache/\n"
-        "Disallow: /cache/status\n"
-        "Disallow: /cache/refresh\n"
-    )
-    return PlainTextResponse(content=rules)
+    return ROBOTS_RESPONSE
 
 def validate_zone_input(zone: str) -> str:
     """Validate and sanitize zone input"""
@@ -219,16 +338,17 @@ def validate_zone_input(zone: str) -> str:
     
     zone_clean = zone.strip().lower()
     
-    if not ZONE_PATTERN.match(zone_clean):
+    # Cheap format check (pzzXXX); zone membership is checked below
+    if len(zone_clean) != 6 or not zone_clean.startswith("pzz") or not zone_clean[3:].isdigit():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid zone format. Expected format: pzzXXX (e.g., pzz133)"
         )
     
-    if zone_clean not in ZONES:
+    if zone_clean not in ZONE_KEYS_FROZENSET:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Zone {zone_clean} not found. Available zones: {list(ZONES.keys())}"
+            detail=f"Zone {zone_clean} not found. Available zones: {ZONE_KEYS_DETAIL}"
         )
     
     return zone_clean
@@ -244,8 +364,8 @@ async def root(request: Request):
             "status": "active",
             "available_zones": len(ZONES),
             "cache_status": {
-                "cached_forecasts": len([f for f in forecast_cache.values() if "error" not in f]),
-                "failed_forecasts": len([f for f in forecast_cache.values() if "error" in f]),
+                "cached_forecasts": cache_metadata["successful_count"],
+                "failed_forecasts": cache_metadata["failed_count"],
                 "last_updated": cache_metadata["last_updated"],
                 "next_update": cache_metadata["next_update"],
                 "total_updates": cache_metadata["total_updates"],
@@ -260,20 +380,20 @@ async def root(request: Request):
         )
 
 @app.get("/health")
-async def health_check():
+async def health_check(request: Request):
     """Health check endpoint for container monitoring"""
     try:
         # Simple health check - verify cache is functioning
-        healthy = len(forecast_cache) > 0 and cache_metadata.get("last_updated") is not None
+        healthy = len(request.app.state.cache) > 0 and cache_metadata.get("last_updated") is not None
         if healthy:
-            return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+            return {"status": "healthy", "uptime_seconds": time.monotonic() - APP_MONO_START}
         else:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 content={"status": "unhealthy", "reason": "cache not initialized"}
             )
     except Exception:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             content={"status": "unhealthy", "reason": "health check failed"}
         )
@@ -283,7 +403,7 @@ async def health_check():
 async def get_zones(request: Request):
     """Get list of all available forecast zones"""
     try:
-        return {"zones": ZONES}
+        return ZONES_RESPONSE
     except Exception as e:
         logger.error(f"Error in zones endpoint: {e}")
         raise HTTPException(
@@ -298,6 +418,8 @@ async def get_forecast(request: Request, zone: str):
     try:
         zone_clean = validate_zone_input(zone)
         
+        forecast_cache = request.app.state.cache
+        
         # Check if we have cached data
         if zone_clean not in forecast_cache:
             raise HTTPException(
@@ -315,7 +437,7 @@ async def get_forecast(request: Request, zone: str):
             )
         
         logger.info(f"Served forecast for zone {zone_clean}")
-        return cached_forecast
+        return Response(content=request.app.state.cache_json[zone_clean], media_type="application/json")
         
     except HTTPException:
         raise
@@ -331,36 +453,15 @@ async def get_forecast(request: Request, zone: str):
 async def get_all_forecasts(request: Request):
     """Get forecasts for all zones (served from cache)"""
     try:
-        if not forecast_cache:
+        all_forecasts_json = request.app.state.all_forecasts_json
+        if not request.app.state.cache or all_forecasts_json is None:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Forecast data not yet available. Cache is being updated."
             )
         
-        # Separate successful forecasts from errors
-        successful_forecasts = []
-        failed_zones = []
-        
-        for zone, forecast_data in forecast_cache.items():
-            if "error" in forecast_data:
-                failed_zones.append({"zone": zone, "error": forecast_data["error"]})
-            else:
-                successful_forecasts.append(forecast_data)
-        
-        logger.info(f"Served all forecasts: {len(successful_forecasts)} successful, {len(failed_zones)} failed")
-        
-        return {
-            "total_zones": len(ZONES),
-            "successful_forecasts": len(successful_forecasts),
-            "failed_forecasts": len(failed_zones),
-            "forecasts": successful_forecasts,
-            "errors": failed_zones if failed_zones else None,
-            "cache_info": {
-                "last_updated": cache_metadata["last_updated"],
-                "next_update": cache_metadata["next_update"],
-                "data_served_from": "cache"
-            }
-        }
+        logger.info("Served all forecasts from pre-serialized cache")
+        return Response(content=all_forecasts_json, media_type="application/json")
         
     except HTTPException:
         raise
@@ -376,19 +477,18 @@ async def get_all_forecasts(request: Request):
 async def get_cache_status(request: Request):
     """Get detailed cache status and statistics"""
     try:
-        successful_zones = [zone for zone, data in forecast_cache.items() if "error" not in data]
-        failed_zones = [zone for zone, data in forecast_cache.items() if "error" in data]
+        successful_count = cache_metadata["successful_count"]
         
         return {
             "cache_metadata": cache_metadata,
             "zones_status": {
                 "total_zones": len(ZONES),
-                "successful_zones": len(successful_zones),
-                "failed_zones": len(failed_zones),
-                "successful_zone_list": successful_zones,
-                "failed_zone_list": failed_zones
+                "successful_zones": successful_count,
+                "failed_zones": cache_metadata["failed_count"],
+                "successful_zone_list": cache_metadata["successful_zones"],
+                "failed_zone_list": cache_metadata["failed_zones"]
             },
-            "cache_health": "healthy" if len(successful_zones) >= len(ZONES) * 0.8 else "degraded"
+            "cache_health": "healthy" if successful_count >= len(ZONES) * 0.8 else "degraded"
         }
     except Exception as e:
         logger.error(f"Error in cache status endpoint: {e}")
@@ -407,7 +507,7 @@ async def refresh_cache(request: Request):
         return {
             "message": "Cache refresh completed",
             "last_updated": cache_metadata["last_updated"],
-            "successful_forecasts": len([f for f in forecast_cache.values() if "error" not in f])
+            "successful_forecasts": cache_metadata["successful_count"]
         }
     except Exception as e:
         logger.error(f"Error in cache refresh endpoint: {e}")
@@ -417,5 +517,14 @@ async def refresh_cache(request: Request):
         )
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop and httptools ship with uvicorn[standard]; uvloop isn't available on Windows
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=1
+    )
@@ -2,17 +2,137 @@
 Marine forecast scraper for fetching data from NOAA text files
 """
 
-import httpx
+import asyncio
+import functools
+import os
 import re
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
 import logging
 
+if TYPE_CHECKING:
+    import httpx
+
 # Set up logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
 logger = logging.getLogger(__name__)
 
+# httpx and dateutil are imported on first use so importing this module stays
+# cheap for callers that never fetch or parse (e.g. cold-start checks)
+_httpx = None
+_date_parser = None
+
+
+def _get_httpx():
+    """Import httpx on first use"""
+    global _httpx
+    if _httpx is None:
+        import httpx
+        _httpx = httpx
+    return _httpx
+
+
+def _get_date_parser():
+    """Import dateutil's parser on first use"""
+    global _date_parser
+    if _date_parser is None:
+        from dateutil import parser
+        _date_parser = parser
+    return _date_parser
+
+# Forecast text patterns, compiled once at import rather than on every parse
+
+# Period header lines start with a dot (e.g., .TONIGHT..., .WED..., etc.).
+# Applied per line with match(); the name class excludes '.', so the greedy
+# repeat stops exactly at the "..." with nothing to backtrack over
+_PERIOD_HEADER_RE = re.compile(r'\.([A-Z][A-Z ]+)\.\.\.(.*)')
+
+# Wind information - more comprehensive pattern
+_WIND_PATTERNS = (
+    r'([NSEW]+\s+wind[^.]+?(?:kt|knots)[^.]*)',
+    r'(Variable\s+wind[^.]+)',
+    r'(Light\s+and\s+variable[^.]+)',
+    r'(Calm[^.]*)'
+)
+
+# Wave information - improved patterns with better boundaries
+_WAVE_PATTERNS = (
+    # Most specific patterns first
+    r'(Waves\s+around\s+[0-9]+\s+(?:ft|feet)\s+or\s+less)',
+    r'(Waves\s+[0-9]+\s+to\s+[0-9]+\s+(?:ft|feet)(?:\s+or\s+less)?)',
+    r'(Waves\s+around\s+[0-9]+\s+(?:ft|feet))',
+    r'(Waves\s+[0-9]+\s+(?:ft|feet)(?:\s+or\s+less)?)',
+    # More general patterns. The atomic group commits to the first "ft"/"feet"
+    # and the bounded repeats cap how far any attempt can scan, so text without
+    # a height can't trigger superlinear backtracking (requires Python 3.11+)
+    r'(Waves\s++around\s++(?>[^.]{1,80}?(?:ft|feet))[^.]{0,120}?)(?=\s*[A-Z][a-z]|\s*[.!]|$)',
+    r'(Waves\s++(?>[^.]{1,80}?(?:ft|feet))[^.]{0,120}?)(?=\s*[A-Z][a-z]|\s*[.!]|$)',
+    # Seas patterns ("Combined seas" is kept whole rather than cut at "seas")
+    r'((?:Combined\s+)?Seas\s+around\s+[0-9]+\s+(?:ft|feet)\s+or\s+less)',
+    r'((?:Combined\s+)?Seas\s+[0-9]+\s+to\s+[0-9]+\s+(?:ft|feet)(?:\s+or\s+less)?)',
+    r'((?:Combined\s+)?Seas\s+around\s+[0-9]+\s+(?:ft|feet))',
+    r'((?:Combined\s+)?Seas\s+[0-9]+\s+(?:ft|feet)(?:\s+or\s+less)?)',
+    r'((?:Combined\s+)?Seas\s++around\s++(?>[^.]{1,80}?(?:ft|feet))[^.]{0,120}?)(?=\s*[A-Z][a-z]|\s*[.!]|$)',
+    r'((?:Combined\s+)?Seas\s++(?>[^.]{1,80}?(?:ft|feet))[^.]{0,120}?)(?=\s*[A-Z][a-z]|\s*[.!]|$)'
+)
+
+# Each category is fused into one alternation so the period text is scanned
+# once per category. Every alternative has exactly one capturing group, so the
+# matching one is match.lastindex; at a given position earlier alternatives win.
+_WIND_RE = re.compile('|'.join(_WIND_PATTERNS), re.IGNORECASE)
+_WAVE_RE = re.compile('|'.join(_WAVE_PATTERNS), re.IGNORECASE)
+
+# Sentences that are just wave details or technical info
+# (one alternation, applied with match() so it is anchored at the sentence start)
+_SKIP_RE = re.compile(
+    r'(?:Wave Detail|Combined seas'
+    r'|\d+\s+ft\s+at\s+\d+\s+seconds'
+    r'|around\s+\d+\s+ft'
+    r'|\d+\s+to\s+\d+\s+ft)',
+    re.IGNORECASE
+)
+
+# Weather-related keywords
+_WEATHER_KEYWORDS = (
+    'shower', 'rain', 'storm', 'thunder', 'clear', 'sunny',
+    'cloudy', 'overcast', 'fog', 'mist', 'chance', 'likely',
+    'possible', 'occasional', 'scattered', 'isolated', 'mainly',
+    'partly', 'mostly', 'becoming', 'then', 'until', 'after',
+    'tstms', 'thunderstorms'
+)
+# Single case-insensitive scan for any keyword instead of one substring search each
+_WEATHER_KEYWORDS_RE = re.compile('|'.join(_WEATHER_KEYWORDS), re.IGNORECASE)
+
+# Typical weather sentence structure
+_WEATHER_PAT_RE = re.compile(
+    r'\b(?:a|an)\s+(?:chance|slight\s+chance)\s+of\s+\w+'
+    r'|\b(?:showers?|rain)\b'
+    r'|\b(?:likely|possible|probable)\b'
+    r'|\bmainly\s+in\s+the\s+(?:morning|afternoon|evening)\b',
+    re.IGNORECASE
+)
+
+# Sentences truncated after "of" that are completed with "showers"
+# ("chance of" also covers "a chance of" and "a slight chance of")
+_TRUNC_RE = re.compile(r'(?:chance|possibility)\s+of$', re.IGNORECASE)
+
+_WS_RE = re.compile(r'\s+')
+# Words following "of" after a located sentence prefix
+_OF_TAIL_RE = re.compile(r'\s+of\s+(\w+(?:\s+\w+)*)', re.IGNORECASE)
+_WAVES_STRIP_RE = re.compile(r'\b(?:Waves?|Seas?)\b\.?', re.IGNORECASE)
+_WAVE_ONLY_RE = re.compile(r'^(?:Waves?|Seas?)\b', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=32)
+def _zone_header_res(zone_upper: str) -> Tuple[re.Pattern, re.Pattern]:
+    """Compiled (full header, name-only fallback) patterns for a zone, cached per zone"""
+    zone_re = re.escape(zone_upper)
+    return (
+        re.compile(rf'{zone_re}-(\d+)-\n(.+?)-\n(.+?)\n', re.IGNORECASE | re.MULTILINE),
+        re.compile(rf'{zone_re}-\d+-\n(.+?)-', re.IGNORECASE)
+    )
+
 
 @dataclass
 class ForecastPeriod:
@@ -38,40 +158,88 @@ class ForecastScraper:
     
     BASE_URL = "https://tgftp.nws.noaa.gov/data/forecasts/marine/coastal/pz"
     
+    # Configure timeout and retry settings for resilience (httpx.Timeout keyword arguments)
+    TIMEOUT_SECONDS = {"connect": 10.0, "read": 30.0, "write": 10.0, "pool": 10.0}
+    
+    def __init__(self, client: Optional["httpx.AsyncClient"] = None, zone_urls: Optional[Mapping[str, str]] = None):
+        """Optionally share a long-lived client so connections are reused across fetches,
+        and a prebuilt {zone: url} map so known zones skip URL construction"""
+        self._client = client
+        # Without an injected client, one is created on first fetch and owned (and closed) here
+        self._owns_client = client is None
+        self._zone_urls = zone_urls or {}
+        self._logged_http_version = False
+        # Per-zone (Last-Modified, text) for conditional GETs
+        self._text_cache: Dict[str, Tuple[str, str]] = {}
+        # Per-zone (text, parsed forecast) so unchanged text isn't re-parsed
+        self._parsed_cache: Dict[str, Tuple[str, MarineForecast]] = {}
+    
+    def _get_client(self) -> "httpx.AsyncClient":
+        """Return the shared client, creating this scraper's own on first use"""
+        if self._client is None:
+            httpx = _get_httpx()
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(**self.TIMEOUT_SECONDS),
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=8)
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the HTTP client if this scraper created it"""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     async def fetch_zone_text(self, zone: str) -> str:
         """Fetch the raw text for a specific zone"""
-        url = f"{self.BASE_URL}/{zone.lower()}.txt"
+        httpx = _get_httpx()
+        zone_key = zone.lower()
+        url = self._zone_urls.get(zone_key) or f"{self.BASE_URL}/{zone_key}.txt"
         
-        # Configure timeout and retry settings for resilience
-        timeout = httpx.Timeout(connect=10.0, read=30.0, write=10.0, pool=10.0)
+        # Ask NOAA to skip the body if the product hasn't changed since last fetch
+        cached = self._text_cache.get(zone_key)
+        headers = {"If-Modified-Since": cached[0]} if cached else None
         
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            try:
-                response = await client.get(url, follow_redirects=True)
-                response.raise_for_status()
-                return response.text
-            except httpx.TimeoutException:
-                logger.error(f"Timeout fetching data for zone {zone}")
-                raise
-            except httpx.HTTPStatusError as e:
-                logger.error(f"HTTP error {e.response.status_code} for zone {zone}: {e}")
-                raise
-            except Exception as e:
-                logger.error(f"Unexpected error fetching zone {zone}: {e}")
-                raise
+        try:
+            response = await self._get_client().get(url, headers=headers, follow_redirects=True)
+            if response.status_code == 304 and cached:
+                logger.info(f"Forecast for zone {zone} not modified")
+                return cached[1]
+            response.raise_for_status()
+            if not self._logged_http_version:
+                logger.info(f"NOAA fetches using {response.http_version}")
+                self._logged_http_version = True
+            text = response.text
+            last_modified = response.headers.get("Last-Modified")
+            if last_modified:
+                self._text_cache[zone_key] = (last_modified, text)
+            return text
+        except httpx.TimeoutException:
+            logger.error(f"Timeout fetching data for zone {zone}")
+            raise
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error {e.response.status_code} for zone {zone}: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error fetching zone {zone}: {e}")
+            raise
     
     def parse_forecast_text(self, text: str, zone: str) -> MarineForecast:
         """Parse the raw forecast text into structured data"""
         
         logger.info(f"Parsing forecast for zone {zone}")
         
+        zone_upper = zone.upper()
+        header_re, fallback_re = _zone_header_res(zone_upper)
+        
         # Extract zone header information
-        zone_match = re.search(rf'{zone.upper()}-(\d+)-\n(.+?)-\n(.+?)\n', text, re.IGNORECASE | re.MULTILINE)
+        zone_match = header_re.search(text)
         if not zone_match:
             logger.warning(f"Could not parse zone header for {zone}, using fallback")
             # Fallback: try to extract zone name from text
-            name_match = re.search(rf'{zone.upper()}-\d+-\n(.+?)-', text, re.IGNORECASE)
-            zone_name = name_match.group(1).strip() if name_match else f"Zone {zone.upper()}"
+            name_match = fallback_re.search(text)
+            zone_name = name_match.group(1).strip() if name_match else f"Zone {zone_upper}"
             expires_str = "999999"  # Default fallback
             issued_str = "Now"
         else:
@@ -91,7 +259,7 @@ class ForecastScraper:
         logger.info(f"Extracted {len(periods)} forecast periods")
         
         return MarineForecast(
-            zone=zone.upper(),
+            zone=zone_upper,
             name=zone_name,
             issued=issued,
             expires=expires,
@@ -100,22 +268,17 @@ class ForecastScraper:
     
     def _parse_timestamp(self, timestamp_str: str) -> datetime:
         """Parse timestamp from forecast text"""
+        # Example: "305 PM PDT Tue Aug 5 2025"
+        # More robust parsing would handle various formats
+        
+        # Clean up the timestamp string
+        cleaned = timestamp_str.strip()
+        
+        # Try to parse with dateutil (handles many formats)
         try:
-            # Example: "305 PM PDT Tue Aug 5 2025"
-            # More robust parsing would handle various formats
-            from dateutil import parser
-            
-            # Clean up the timestamp string
-            cleaned = timestamp_str.strip()
-            
-            # Try to parse with dateutil (handles many formats)
-            try:
-                return parser.parse(cleaned)
-            except:
-                # Fallback to current time if parsing fails
-                return datetime.now()
-                
-        except:
+            return _get_date_parser().parse(cleaned)
+        except (ValueError, TypeError, OverflowError):
+            # Fallback to current time if parsing fails
             return datetime.now()
     
     def _parse_expires(self, expires_str: str) -> datetime:
@@ -128,7 +291,6 @@ class ForecastScraper:
                 minute = int(expires_str[4:6])
                 
                 # Assume current month/year for simplicity
-                from datetime import datetime
                 now = datetime.now()
                 expires = now.replace(day=day, hour=hour, minute=minute, second=0, microsecond=0)
                 
@@ -143,85 +305,85 @@ class ForecastScraper:
             else:
                 # Fallback
                 return datetime.now()
-        except:
+        except (ValueError, OverflowError):
+            # Bad digits or an out-of-range day for this month
             return datetime.now()
     
+    def _split_periods(self, text: str) -> List[Tuple[str, str]]:
+        """Split forecast text into (name, body) pairs in a single pass over its lines,
+        joining each body's wrapped lines with single spaces"""
+        periods = []
+        current_name = None
+        current_body: List[str] = []
+        
+        for line in text.splitlines():
+            header = _PERIOD_HEADER_RE.match(line)
+            if header:
+                # A new period header closes the previous period
+                if current_name is not None:
+                    periods.append((current_name, ' '.join(current_body)))
+                current_name = header.group(1)
+                current_body = [header.group(2).strip()]
+            elif current_name is not None:
+                # Bodies run until a blank line or the $$ product terminator
+                if not line.strip() or line.startswith('$$'):
+                    periods.append((current_name, ' '.join(current_body)))
+                    current_name = None
+                else:
+                    current_body.append(line.strip())
+        
+        if current_name is not None:
+            periods.append((current_name, ' '.join(current_body)))
+        
+        return periods
+    
     def _extract_periods(self, text: str) -> List[ForecastPeriod]:
         """Extract forecast periods from text"""
         periods = []
         
-        # Find all periods starting with dots (e.g., .TONIGHT, .WED, etc.)
-        period_pattern = r'\.([A-Z][A-Z\s]+?)\.\.\.(.+?)(?=\n\.|$$)'
-        matches = re.findall(period_pattern, text, re.DOTALL | re.MULTILINE)
-        
-        for period_name, period_text in matches:
+        for period_name, period_text in self._split_periods(text):
             period_name = period_name.strip()
             period_text = period_text.strip()
             
-            # Extract wind information - more comprehensive pattern
-            wind_patterns = [
-                r'([NSEW]+\s+wind[^.]+?(?:kt|knots)[^.]*)',
-                r'(Variable\s+wind[^.]+)',
-                r'(Light\s+and\s+variable[^.]+)',
-                r'(Calm[^.]*)'
-            ]
+            # Extract wind information
             wind = ""
-            for pattern in wind_patterns:
-                wind_match = re.search(pattern, period_text, re.IGNORECASE)
-                if wind_match:
-                    wind = wind_match.group(1).strip()
-                    break
+            wind_match = _WIND_RE.search(period_text)
+            if wind_match:
+                wind = wind_match.group(wind_match.lastindex).strip()
             
-            # Extract wave information - improved patterns with better boundaries
-            wave_patterns = [
-                # Most specific patterns first
-                r'(Waves\s+around\s+[0-9]+\s+(?:ft|feet)\s+or\s+less)',
-                r'(Waves\s+[0-9]+\s+to\s+[0-9]+\s+(?:ft|feet)(?:\s+or\s+less)?)',
-                r'(Waves\s+around\s+[0-9]+\s+(?:ft|feet))',
-                r'(Waves\s+[0-9]+\s+(?:ft|feet))',
-                # More general patterns
-                r'(Waves\s+around\s+[^.]+?(?:ft|feet)[^.]*?)(?=\s*[A-Z][a-z]|\s*[.!]|$)',
-                r'(Waves\s+[^.]+?(?:ft|feet)[^.]*?)(?=\s*[A-Z][a-z]|\s*[.!]|$)',
-                # Seas patterns
-                r'(Seas\s+around\s+[0-9]+\s+(?:ft|feet)\s+or\s+less)',
-                r'(Seas\s+[0-9]+\s+to\s+[0-9]+\s+(?:ft|feet)(?:\s+or\s+less)?)',
-                r'(Seas\s+around\s+[0-9]+\s+(?:ft|feet))',
-                r'(Seas\s+[0-9]+\s+(?:ft|feet))',
-                r'(Seas\s+around\s+[^.]+?(?:ft|feet)[^.]*?)(?=\s*[A-Z][a-z]|\s*[.!]|$)',
-                r'(Seas\s+[^.]+?(?:ft|feet)[^.]*?)(?=\s*[A-Z][a-z]|\s*[.!]|$)'
-            ]
+            # Extract wave information
             waves = ""
-            for pattern in wave_patterns:
-                wave_match = re.search(pattern, period_text, re.IGNORECASE)
-                if wave_match:
-                    waves = wave_match.group(1).strip()
-                    # Clean up common issues
-                    waves = re.sub(r'\s+', ' ', waves)
-                    # Make sure it ends properly
-                    if not waves.endswith('.'):
-                        waves = waves.rstrip('.,!') 
-                    break
+            wave_match = _WAVE_RE.search(period_text)
+            if wave_match:
+                # Collapse whitespace and trim trailing punctuation in one pass
+                # (the patterns never capture a '.', so there's none to keep)
+                waves = _WS_RE.sub(' ', wave_match.group(wave_match.lastindex)).rstrip('.,! ')
             
             # Extract weather conditions - everything else after removing wind/waves
             # Split by sentences and find weather-related content
-            remaining_text = period_text
-            if wind:
-                remaining_text = remaining_text.replace(wind, '')
-            if waves:
-                remaining_text = remaining_text.replace(waves, '')
+            # Carve the matched wind/wave spans out of the body in one pass
+            cuts = sorted(m.span(m.lastindex) for m in (wind_match, wave_match) if m)
+            pieces = []
+            pos = 0
+            for start, end in cuts:
+                if start > pos:
+                    pieces.append(period_text[pos:start])
+                pos = max(pos, end)
+            pieces.append(period_text[pos:])
+            remaining_text = ''.join(pieces)
             
             # Clean up and extract weather
             weather_text = remaining_text.strip(' .,\n')
             
             # Remove any standalone "Waves" or "Seas" words that got left behind
-            weather_text = re.sub(r'\b(Waves?|Seas?)\b\.?', '', weather_text, flags=re.IGNORECASE)
+            weather_text = _WAVES_STRIP_RE.sub('', weather_text)
             weather_text = weather_text.strip(' .,\n')
             
             # Look for complete weather phrases and sentences
             weather_sentences = []
             
             # Split by periods and process each sentence
-            sentences = re.split(r'[.]', weather_text)
+            sentences = weather_text.split('.')
             
             for sentence in sentences:
                 sentence = sentence.strip()
@@ -229,79 +391,52 @@ class ForecastScraper:
                     continue
                 
                 # Skip sentences that are just wave details or technical info
-                skip_patterns = [
-                    r'^(Wave Detail|Combined seas)',
-                    r'^\d+\s+ft\s+at\s+\d+\s+seconds',
-                    r'^around\s+\d+\s+ft',
-                    r'^\d+\s+to\s+\d+\s+ft'
-                ]
-                
-                if any(re.match(pattern, sentence, re.IGNORECASE) for pattern in skip_patterns):
+                if _SKIP_RE.match(sentence):
                     continue
                 
-                # Look for weather-related content
-                weather_keywords = [
-                    'shower', 'rain', 'storm', 'thunder', 'clear', 'sunny', 
-                    'cloudy', 'overcast', 'fog', 'mist', 'chance', 'likely',
-                    'possible', 'occasional', 'scattered', 'isolated', 'mainly',
-                    'partly', 'mostly', 'becoming', 'then', 'until', 'after',
-                    'tstms', 'thunderstorms'
-                ]
-                
                 # Check if sentence contains weather keywords or looks like weather
-                has_weather = any(keyword in sentence.lower() for keyword in weather_keywords)
+                has_weather = _WEATHER_KEYWORDS_RE.search(sentence) is not None
                 
                 # Also include sentences that have typical weather sentence structure
-                weather_patterns = [
-                    r'\b(a|an)\s+(chance|slight\s+chance)\s+of\s+\w+',
-                    r'\b(showers?|rain)\b',
-                    r'\b(likely|possible|probable)\b',
-                    r'\bmainly\s+in\s+the\s+(morning|afternoon|evening)\b'
-                ]
-                
-                has_weather_pattern = any(re.search(pattern, sentence, re.IGNORECASE) for pattern in weather_patterns)
+                has_weather_pattern = _WEATHER_PAT_RE.search(sentence) is not None
                 
                 if has_weather or has_weather_pattern:
                     # Clean up the sentence
-                    sentence = re.sub(r'\s+', ' ', sentence).strip()
+                    sentence = _WS_RE.sub(' ', sentence).strip()
                     
                     # Fix common truncation issues by looking for context
                     if sentence.endswith(' of'):
-                        # Try to find what comes after "of" in the original text
-                        # Look for the pattern in context
-                        of_pattern = rf'{re.escape(sentence[:-3])}\s+of\s+(\w+(?:\s+\w+)*)'
-                        of_match = re.search(of_pattern, period_text, re.IGNORECASE)
+                        # Try to find what comes after "of" in the original text:
+                        # locate the sentence prefix, then match the tail right after it
+                        prefix = sentence[:-3]
+                        prefix_lower = prefix.lower()
+                        period_lower = period_text.lower()
+                        of_match = None
+                        idx = period_lower.find(prefix_lower)
+                        while idx != -1 and not of_match:
+                            of_match = _OF_TAIL_RE.match(period_text, idx + len(prefix))
+                            idx = period_lower.find(prefix_lower, idx + 1)
                         if of_match:
-                            sentence = sentence[:-3] + ' of ' + of_match.group(1)
+                            sentence = sentence[:-3] + ' of ' + _WS_RE.sub(' ', of_match.group(1))
                         else:
                             # Common weather completions
-                            weather_completions = {
-                                'a chance of': 'showers',
-                                'a slight chance of': 'showers', 
-                                'chance of': 'showers',
-                                'possibility of': 'showers'
-                            }
-                            sentence_lower = sentence.lower()
-                            for phrase, completion in weather_completions.items():
-                                if sentence_lower.endswith(phrase):
-                                    sentence = sentence + ' ' + completion
-                                    break
+                            if _TRUNC_RE.search(sentence):
+                                sentence += ' showers'
                     
                     weather_sentences.append(sentence)
             
             # Join weather sentences
             if weather_sentences:
+                # Each sentence is already whitespace-normalized and stripped
                 weather = '. '.join(weather_sentences)
-                # Final cleanup
-                weather = re.sub(r'\s+', ' ', weather).strip()
-                # Ensure proper capitalization
-                if weather and not weather[0].isupper():
-                    weather = weather[0].upper() + weather[1:]
+                # Ensure proper capitalization (upper() is a no-op if already capitalized)
+                if weather:
+                    weather = weather[:1].upper() + weather[1:]
             else:
                 weather = None
             
             # Final check - don't put wave-only content in weather
-            if weather and re.match(r'^(Waves?|Seas?)\b', weather, re.IGNORECASE):
+            if weather and _WAVE_ONLY_RE.match(weather):
                 weather = None
             
             periods.append(ForecastPeriod(
@@ -316,4 +451,18 @@ class ForecastScraper:
     async def get_forecast(self, zone: str) -> MarineForecast:
         """Get complete forecast for a zone"""
         text = await self.fetch_zone_text(zone)
-        return self.parse_forecast_text(text, zone)
+        
+        # Reuse the last parse when the text is unchanged (a 304, or a 200 with the same body)
+        zone_key = zone.lower()
+        cached = self._parsed_cache.get(zone_key)
+        if cached and cached[0] == text:
+            return cached[1]
+        
+        # Parse in a worker thread so other zones' fetches keep progressing
+        forecast = await asyncio.to_thread(self.parse_forecast_text, text, zone)
+        self._parsed_cache[zone_key] = (text, forecast)
+        return forecast
+    
+    async def get_forecasts(self, zones: List[str]) -> List[MarineForecast]:
+        """Get forecasts for several zones, fetching them concurrently"""
+        return await asyncio.gather(*(self.get_forecast(zone) for zone in zones))
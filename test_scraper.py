@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the NOAA zone forecast parser
+"""
+import asyncio
+import sys
+import os
+import time
+
+import httpx
+import pytest
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from scraper import ForecastScraper, ForecastPeriod, _WAVE_RE
+
+INLAND_ZONE_TEXT = """PZZ135-151115-
+Puget Sound and Hood Canal-
+244 PM PDT Tue Oct 14 2026
+
+.TONIGHT...S wind 5 to 15 kt, becoming SW 10 to 20 kt after
+midnight. Waves 1 to 3 ft. A chance of showers in the
+evening.
+.WED...Variable wind 5 kt or less. Waves 1 ft or less. Patchy
+fog in the morning.
+.WED NIGHT...N wind 10 to 15 kt. Waves around 2 ft. Mostly
+clear.
+
+$$
+"""
+
+COASTAL_ZONE_TEXT = """PZZ150-151115-
+Coastal Waters From Cape Flattery To James Island Out 10 Nm-
+244 PM PDT Tue Oct 14 2026
+
+...SMALL CRAFT ADVISORY IN EFFECT THROUGH WEDNESDAY AFTERNOON...
+
+.TONIGHT...NW wind 15 to 25 kt, easing to 10 to 20 kt after
+midnight. Seas 8 to 10 ft. Wave Detail: W 9 ft at 11 seconds.
+A slight chance of showers.
+.WED...NW wind 10 to 20 kt. Seas 6 to 8 ft. Wave Detail: W 7 ft
+at 10 seconds. Partly cloudy.
+.THU THROUGH FRI...SE wind around 10 kt. Combined seas 4 ft.
+Rain possible.
+
+$$
+"""
+
+
+def test_inland_zone_with_wrapped_periods():
+    forecast = ForecastScraper().parse_forecast_text(INLAND_ZONE_TEXT, "pzz135")
+
+    assert forecast.zone == "PZZ135"
+    assert forecast.name == "Puget Sound and Hood Canal"
+    assert forecast.periods == [
+        ForecastPeriod(
+            name="TONIGHT",
+            wind="S wind 5 to 15 kt, becoming SW 10 to 20 kt after midnight",
+            waves="Waves 1 to 3 ft",
+            weather="A chance of showers in the evening",
+        ),
+        ForecastPeriod(
+            name="WED",
+            wind="Variable wind 5 kt or less",
+            waves="Waves 1 ft or less",
+            weather="Patchy fog in the morning",
+        ),
+        ForecastPeriod(
+            name="WED NIGHT",
+            wind="N wind 10 to 15 kt",
+            waves="Waves around 2 ft",
+            weather="Mostly clear",
+        ),
+    ]
+
+
+def test_coastal_zone_with_advisory_and_wave_detail():
+    forecast = ForecastScraper().parse_forecast_text(COASTAL_ZONE_TEXT, "pzz150")
+
+    assert forecast.zone == "PZZ150"
+    assert forecast.name == "Coastal Waters From Cape Flattery To James Island Out 10 Nm"
+    assert forecast.periods == [
+        ForecastPeriod(
+            name="TONIGHT",
+            wind="NW wind 15 to 25 kt, easing to 10 to 20 kt after midnight",
+            waves="Seas 8 to 10 ft",
+            weather="A slight chance of showers",
+        ),
+        ForecastPeriod(
+            name="WED",
+            wind="NW wind 10 to 20 kt",
+            waves="Seas 6 to 8 ft",
+            weather="Partly cloudy",
+        ),
+        ForecastPeriod(
+            name="THU THROUGH FRI",
+            wind="SE wind around 10 kt",
+            waves="Combined seas 4 ft",
+            weather="Rain possible",
+        ),
+    ]
+
+
+def test_conditional_get_reuses_parse_on_304(monkeypatch):
+    last_modified = "Tue, 14 Oct 2026 21:44:00 GMT"
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("If-Modified-Since") == last_modified:
+            return httpx.Response(304)
+        return httpx.Response(200, text=INLAND_ZONE_TEXT, headers={"Last-Modified": last_modified})
+
+    scraper = ForecastScraper(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    parse_calls = []
+    parse = scraper.parse_forecast_text
+
+    def counting_parse(text, zone):
+        parse_calls.append(zone)
+        return parse(text, zone)
+
+    monkeypatch.setattr(scraper, "parse_forecast_text", counting_parse)
+
+    async def fetch_twice():
+        try:
+            return await scraper.get_forecast("pzz135"), await scraper.get_forecast("pzz135")
+        finally:
+            await scraper._get_client().aclose()
+
+    first, second = asyncio.run(fetch_twice())
+
+    assert "If-Modified-Since" not in requests[0].headers
+    assert requests[1].headers["If-Modified-Since"] == last_modified
+    assert parse_calls == ["pzz135"]
+    assert second is first
+
+
+# Bodies that made the old open-ended wave patterns backtrack superlinearly;
+# each is roughly the size of a full pzz135 product
+ADVERSARIAL_WAVE_BODIES = [
+    "Waves " * 3000,
+    "Waves" + " " * 20000 + "x",
+    "Waves around " * 2000,
+    "Seas " * 3000,
+    "Seas around " * 2000,
+]
+
+
+@pytest.mark.parametrize("body", ADVERSARIAL_WAVE_BODIES, ids=["waves", "whitespace", "waves-around", "seas", "seas-around"])
+def test_wave_patterns_stay_linear_on_adversarial_input(body):
+    start = time.perf_counter()
+    _WAVE_RE.search(body)
+    ForecastScraper().parse_forecast_text(f".TONIGHT...{body}\n$$\n", "pzz135")
+    assert time.perf_counter() - start < 1.0